@@ -58,7 +58,8 @@ class ExpressionContextModule:
             if ecm.wildcard:
                 out.update({name: member for name, member in inspect.getmembers(mod) if not name.startswith("_")})
 
-        _logger.debug("Expression context contains %d items (listed on the next line):\n%s", len(out), list(out))
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Expression context contains %d items (listed on the next line):\n%s", len(out), list(out))
         return out
 
 
@@ -5,6 +5,7 @@
 from __future__ import annotations
 from typing import Iterable, Tuple, Callable, Dict, Optional, List
 import sys
+import logging
 import functools
 import threading
 import yakut
@@ -26,6 +27,7 @@ class JoystickController(Controller):
     """
 
     def __init__(self, index: int) -> None:
+        _ensure_worker_started()
         self._handle = sdl2.joystick.SDL_JoystickOpen(index)
         if not self._handle:
             raise ControllerNotFoundError(f"Cannot open joystick {index}")
@@ -40,9 +42,10 @@ class JoystickController(Controller):
         self._axes: List[float] = [
             JoystickController._scale_axis(sdl2.joystick.SDL_JoystickGetAxis(self._handle, i)) for i in range(n_axes)
         ]
-        self._hats: List[Tuple[int, int]] = [
-            JoystickController._split_hat(sdl2.joystick.SDL_JoystickGetHat(self._handle, i)) for i in range(n_hats)
-        ]
+        # Each hat is stored as two adjacent axes (X, Y) so that sampling does not need to unpack them.
+        self._hats: List[float] = [0.0] * (n_hats * 2)
+        for i in range(n_hats):
+            self._update_hat(i, sdl2.joystick.SDL_JoystickGetHat(self._handle, i))
         self._buttons: List[bool] = [sdl2.joystick.SDL_JoystickGetButton(self._handle, i) for i in range(n_buttons)]
         self._counters: List[int] = [0 for _ in self._buttons]
 
@@ -66,13 +69,8 @@ class JoystickController(Controller):
             if _exception:
                 raise ControllerError("Worker thread failed") from _exception
 
-            axes_and_hats = self._axes.copy()
-            for x, y in self._hats:
-                axes_and_hats.append(float(x))
-                axes_and_hats.append(float(y))
-
             return Sample(
-                axis=dict(enumerate(axes_and_hats)),
+                axis=dict(enumerate(self._axes + self._hats)),
                 button=dict(enumerate(self._buttons)),
                 toggle={k: v % 2 != 0 for k, v in enumerate(self._counters)},
             )
@@ -97,13 +95,18 @@ class JoystickController(Controller):
                 self._buttons[event.jbutton.button] = False
 
         elif event.type == sdl2.SDL_JOYHATMOTION:
-            self._hats[event.jhat.hat] = JoystickController._split_hat(event.jhat.value)
+            self._update_hat(event.jhat.hat, event.jhat.value)
 
-        else:
+        elif _debug_enabled:
             _logger.debug("%s: Event dropped: %r", self, event)
 
         self._update_hook()
 
+    def _update_hat(self, hat: int, value: int) -> None:
+        x, y = JoystickController._split_hat(value)
+        self._hats[hat * 2] = float(x)
+        self._hats[hat * 2 + 1] = float(y)
+
     @staticmethod
     def _scale_axis(raw: int) -> float:
         if raw >= 0:
@@ -123,9 +126,7 @@ class JoystickController(Controller):
             with _lock:
                 return JoystickController(index)
 
-        if not _init_done.wait(10.0):  # pragma: no cover
-            raise _exception or ControllerError("The worker thread has failed to initialize")
-
+        _ensure_worker_started()
         with _lock:
             num_joys = sdl2.joystick.SDL_NumJoysticks()
             for idx in range(num_joys):
@@ -137,6 +138,25 @@ _exception: Optional[Exception] = None
 _lock = threading.RLock()
 _init_done = threading.Event()
 _registry: Dict[sdl2.SDL_JoystickID, Callable[[sdl2.SDL_Event], None]] = {}
+_worker: Optional[threading.Thread] = None
+_debug_enabled = False
+"""
+Evaluated once by the worker thread; guards the debug logging on the event dispatch path.
+"""
+
+
+def _ensure_worker_started() -> None:
+    """
+    The worker is launched on first use rather than at import so that merely importing this module
+    (e.g., when listing the available controller kinds) does not initialize SDL.
+    """
+    global _worker  # pylint: disable=global-statement
+    with _lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_run_sdl2, name="sdl2_worker", daemon=True)
+            _worker.start()
+    if not _init_done.wait(10.0):  # pragma: no cover
+        raise _exception or ControllerError("The worker thread has failed to initialize")
 
 
 def _dispatch_joy(joystick: sdl2.SDL_JoystickID, event: sdl2.SDL_Event) -> None:
@@ -144,12 +164,13 @@ def _dispatch_joy(joystick: sdl2.SDL_JoystickID, event: sdl2.SDL_Event) -> None:
         try:
             _registry[joystick](event)
         except KeyError:
-            _logger.debug("No handler for joystick %r; dropping event %r", joystick, event)
+            if _debug_enabled:
+                _logger.debug("No handler for joystick %r; dropping event %r", joystick, event)
 
 
 def _run_sdl2() -> None:
     # Shall we require SDL2 somewhere else in this app, this logic will have to be extracted into a shared component.
-    global _exception  # pylint: disable=global-statement
+    global _exception, _debug_enabled  # pylint: disable=global-statement
     try:
         import ctypes
 
@@ -165,6 +186,9 @@ def _run_sdl2() -> None:
         sdl2.SDL_JoystickEventState(sdl2.SDL_ENABLE)
         sdl2.SDL_SetHint(sdl2.SDL_HINT_JOYSTICK_ALLOW_BACKGROUND_EVENTS, b"1")
 
+        # The logging level is configured before the controllers are listed, so it is safe to evaluate it once here.
+        # Events may arrive at a high rate, so we avoid formatting them for the logging machinery on every dispatch.
+        _debug_enabled = _logger.isEnabledFor(logging.DEBUG)
         _logger.debug("SDL2 initialized successfully, entering the event loop")
         _init_done.set()
 
@@ -181,7 +205,7 @@ def _run_sdl2() -> None:
                 _dispatch_joy(event.jbutton.which, event)
             elif event.type == sdl2.SDL_JOYHATMOTION:
                 _dispatch_joy(event.jhat.which, event)
-            else:
+            elif _debug_enabled:
                 _logger.debug("Event dropped: %r", event)
 
     except Exception as ex:  # pylint: disable=broad-except
@@ -190,5 +214,3 @@ def _run_sdl2() -> None:
 
 
 _logger = yakut.get_logger(__name__)
-
-threading.Thread(target=_run_sdl2, name="sdl2_worker", daemon=True).start()
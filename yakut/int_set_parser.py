@@ -57,12 +57,6 @@ def parse_int_set(text: str) -> set[int] | int:
     IntSetError: ...
     """
 
-    def try_parse(val: str) -> int | None:
-        try:
-            return int(val, 0)
-        except ValueError:
-            return None
-
     collapse = not _RE_JSON_LIST.match(text)
     incl: set[int] = set()
     excl: set[int] = set()
@@ -76,19 +70,19 @@ def parse_int_set(text: str) -> set[int] | int:
             item = item[1:]
         else:
             target_set = incl
-        x = try_parse(item)
+        x = _try_parse_int(item)
         if x is not None:
             target_set.add(x)
             continue
         match = _RE_RANGE.match(item)
         if match:
-            lo, hi = map(try_parse, match.groups())
+            lo, hi = map(_try_parse_int, match.groups())
             if lo is not None and hi is not None:
-                target_set |= set(range(lo, hi))
+                target_set.update(range(lo, hi))
                 continue
         raise IntSetError(f"Item {item!r} of the integer set {text!r} could not be parsed")
 
-    result: set[int] | int = incl - excl
+    result: set[int] | int = (incl - excl) if excl else incl
     assert isinstance(result, set)
     if collapse and len(result) == 1:
         (result,) = result
@@ -96,6 +90,26 @@ def parse_int_set(text: str) -> set[int] | int:
     return result
 
 
+def _try_parse_int(val: str) -> int | None:
+    """
+    Like ``int(val, 0)`` but returns None instead of raising.
+    Plain decimals and obvious non-integers (like intervals) are handled without the costly exception path.
+
+    >>> _try_parse_int("123"), _try_parse_int("-0x10"), _try_parse_int("0"), _try_parse_int("+4")
+    (123, -16, 0, 4)
+    >>> _try_parse_int("010"), _try_parse_int("1-5"), _try_parse_int("1..5"), _try_parse_int("abc")
+    (None, None, None, None)
+    """
+    if val.isascii() and val.isdecimal() and val[0] != "0":
+        return int(val)
+    if "." in val or "-" in val[1:]:
+        return None
+    try:
+        return int(val, 0)
+    except ValueError:
+        return None
+
+
 _RE_JSON_LIST = re.compile(r"^\s*\[([^]]*)]\s*$")
 _RE_SPLIT = re.compile(r"[,;]")
 _RE_RANGE = re.compile(r"([+-]?\w+)(?:-|\.\.\.?)([+-]?\w+)")
@@ -4,13 +4,16 @@
 # mypy: warn_unused_ignores=False
 
 from __future__ import annotations
+import os
 import sys
+import queue
+import atexit
 import asyncio
 import functools
 from typing import TYPE_CHECKING, Iterable, Optional, Any, Callable, Awaitable
 import logging
+import logging.handlers
 from pathlib import Path
-from shutil import get_terminal_size
 import click
 import yakut
 from yakut.param.transport import transport_factory_option, TransportFactory, Transport
@@ -21,12 +24,18 @@ if TYPE_CHECKING:
     import pycyphal.application
 
 
+@functools.lru_cache(None)
 def get_logger(name: str) -> logging.Logger:
     """
     This is a trivial wrapper over :func:`logging.getLogger` that removes private components from the logger name.
     For example, ``yakut.cmd.file_server._cmd`` becomes ``yakut.cmd.file_server`` (private submodule hidden).
     Also, double underscores are removed.
     All this is done to make the log messages appear nicer, since this is important for a CLI tool.
+    The result is cached because the set of names is small and bounded by the number of modules.
+
+    Log calls should pass their arguments for lazy %-formatting rather than formatting the message eagerly.
+    If building an argument is expensive (e.g., it involves constructing a collection), the call should be guarded
+    with ``if _logger.isEnabledFor(logging.DEBUG):`` so that no work is done at the default verbosity level.
     """
     return logging.getLogger(name.replace("__", "").split("._", 1)[0])
 
@@ -35,10 +44,18 @@ _logger = get_logger("yakut")
 # Some of the integration tests may parse the logs expecting its lines to follow this format.
 # If you change this, you may break these tests.
 _LOG_FORMAT = "%(asctime)s %(process)07d %(levelname)-3.3s %(name)s: %(message)s"
-logging.basicConfig(format=_LOG_FORMAT)  # Using the default log level; it will be overridden later.
+_log_handler: Optional[logging.Handler] = None
+"""
+The root handler installed by this module. It is replaced when logging is configured; other handlers are kept.
+"""
+if not logging.root.handlers:  # Using the default log level; it will be overridden later.
+    logging.basicConfig(format=_LOG_FORMAT)
+    _log_handler = logging.root.handlers[0]
 
 
 class Purser:
+    __slots__ = ("_paths", "_f_formatter", "_f_transport", "_f_node", "_registry", "_transport", "_node")
+
     def __init__(
         self,
         paths: Iterable[str | Path],
@@ -46,7 +63,7 @@ class Purser:
         transport_factory: TransportFactory,
         node_factory: NodeFactory,
     ) -> None:
-        self._paths = list(Path(x) for x in paths)
+        self._paths = tuple(x if isinstance(x, Path) else Path(x) for x in paths)
         self._f_formatter = formatter_factory
         self._f_transport = transport_factory
         self._f_node = node_factory
@@ -56,8 +73,8 @@ class Purser:
         self._node: Optional["pycyphal.application.Node"] = None
 
     @property
-    def paths(self) -> list[Path]:
-        return list(self._paths)
+    def paths(self) -> tuple[Path, ...]:
+        return self._paths
 
     def make_formatter(self, hints: FormatterHints = FormatterHints()) -> Formatter:
         return self._f_formatter(hints)
@@ -71,24 +88,31 @@ class Purser:
 
         :raises: :class:`ImportError` if the standard DSDL namespace ``uavcan`` is not available.
         """
-        if self._registry is None:
+        reg = self._registry
+        if reg is None:
             from pycyphal.application import make_registry
 
-            self._registry = make_registry()
-        return self._registry
+            reg = self._registry = make_registry()
+        return reg
 
     def get_transport(self) -> Transport:
-        if self._transport is None:  # pragma: no branch
-            self._transport = self._f_transport()
-        if self._transport is not None:
-            return self._transport
-        click.get_current_context().fail("Transport not configured, or the standard DSDL namespace is not compiled")
+        tr = self._transport
+        if tr is None:  # pragma: no branch
+            tr = self._f_transport()
+            if tr is None:
+                click.get_current_context().fail(
+                    "Transport not configured, or the standard DSDL namespace is not compiled"
+                )
+            self._transport = tr
+        return tr
 
     def get_node(self, name_suffix: str, allow_anonymous: bool) -> "pycyphal.application.Node":
-        if self._node is None:  # pragma: no branch
-            tr = self.get_transport()
-            self._node = self._f_node(tr, name_suffix=name_suffix, allow_anonymous=allow_anonymous)
-        return self._node
+        node = self._node
+        if node is None:  # pragma: no branch
+            node = self._node = self._f_node(
+                self.get_transport(), name_suffix=name_suffix, allow_anonymous=allow_anonymous
+            )
+        return node
 
 
 pass_purser = click.make_pass_decorator(Purser)
@@ -103,8 +127,9 @@ class AliasedGroup(click.Group):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self._commands: dict[str, set[str]] = {}
+        self._commands: dict[str, tuple[str, ...]] = {}  # Aliases are sorted on insertion to simplify help rendering.
         self._aliases: dict[str, str] = {}
+        self._max_name_len: int | None = None  # Invalidated when a new command is added.
 
     def command(self, *args: Any, **kwargs: Any) -> Any:
         aliases = AliasedGroup._mk_aliases(kwargs.pop("aliases", []))
@@ -115,7 +140,7 @@ class AliasedGroup(click.Group):
         def _decorator(f: Any) -> Any:
             cmd: Any = decorator(f)
             if aliases:
-                self._commands[cmd.name] = aliases
+                self._commands[cmd.name] = tuple(sorted(aliases))
                 for alias in aliases:
                     self._aliases[alias] = cmd.name
             return cmd
@@ -131,15 +156,19 @@ class AliasedGroup(click.Group):
         def _decorator(f: Any) -> Any:
             cmd: Any = decorator(f)
             if aliases:
-                self._commands[cmd.name] = aliases
+                self._commands[cmd.name] = tuple(sorted(aliases))
                 for alias in aliases:
                     self._aliases[alias] = cmd.name
             return cmd
 
         return _decorator
 
+    def add_command(self, cmd: click.Command, name: str | None = None) -> None:
+        super().add_command(cmd, name)
+        self._max_name_len = None
+
     def get_command(self, ctx: click.Context, cmd_name: str) -> Any:
-        cmd_name = self._aliases.get(cmd_name, cmd_name)
+        cmd_name = self._aliases.get(cmd_name) or cmd_name
         return super().get_command(ctx, cmd_name)
 
     def resolve_command(
@@ -158,13 +187,14 @@ class AliasedGroup(click.Group):
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         rows: list[tuple[str, str]] = []
         sub_commands = self.list_commands(ctx)
-        max_len = max(len(cmd) for cmd in sub_commands)
-        limit = formatter.width - 6 - max_len
+        if self._max_name_len is None:
+            self._max_name_len = max(len(cmd) for cmd in sub_commands)
+        limit = formatter.width - 6 - self._max_name_len
         for subcmd in sub_commands:
             cmd = self.get_command(ctx, subcmd)
             if cmd is not None and not getattr(cmd, "hidden", False):
                 if subcmd in self._commands:
-                    subcmd = ",".join([subcmd] + list(sorted(self._commands[subcmd])))
+                    subcmd = ",".join((subcmd, *self._commands[subcmd]))
                 rows.append((subcmd, cmd.get_short_help_str(limit)))
         if rows:
             with formatter.section("Commands (with aliases)"):
@@ -173,9 +203,9 @@ class AliasedGroup(click.Group):
     @staticmethod
     def _mk_aliases(item: Any) -> set[str]:
         if isinstance(item, str):
-            return {item}
+            return {sys.intern(item)}
         if isinstance(item, (list, tuple, set)) and all(isinstance(x, str) for x in item):
-            return set(item)
+            return set(map(sys.intern, item))
         raise TypeError(f"Bad aliases: {item}")
 
 
@@ -185,7 +215,9 @@ _ENV_VAR_PATH = "YAKUT_PATH"
 @click.command(
     cls=AliasedGroup,
     context_settings={
-        "max_content_width": get_terminal_size()[0],
+        # Click queries the terminal width itself when rendering help, but limits it to 80 columns by default.
+        # Lifting the limit lets the help use the full width without querying the terminal at import time.
+        "max_content_width": sys.maxsize,
         "auto_envvar_prefix": "YAKUT",  # Specified here, not in __main__.py, otherwise doesn't work when installed.
     },
 )
@@ -242,8 +274,12 @@ def _click_main(
     _configure_logging(verbose)  # This should be done in the first order to ensure that we log things correctly.
 
     _logger.debug("Path: %r", path)
-    for p in path:
-        sys.path.append(str(p))
+    # Skip entries that are already present because every sys.path entry slows down all subsequent imports.
+    known = set(sys.path)
+    for p in map(str, path):
+        if p not in known:
+            known.add(p)
+            sys.path.append(p)
 
     ctx.obj = Purser(
         paths=path,
@@ -271,6 +307,7 @@ def main() -> None:  # https://click.palletsprojects.com/en/8.1.x/exceptions/
 
     except click.ClickException as ex:
         status = ex.exit_code
+        _flush_log_listener()
         try:
             click.secho("", err=True, fg="red", bold=True, reset=False, nl=False)
             ex.show()
@@ -278,10 +315,12 @@ def main() -> None:  # https://click.palletsprojects.com/en/8.1.x/exceptions/
             click.secho("", err=True, nl=False)
 
     except Exception as ex:  # pylint: disable=broad-except
+        _flush_log_listener()
         show_error(f"{type(ex).__name__}: {ex}")
         _logger.debug("EXCEPTION %s: %s", type(ex).__name__, ex, exc_info=True)
 
     except BaseException as ex:  # pylint: disable=broad-except
+        _flush_log_listener()
         show_error(f"Internal error, please report: {ex}")
         _logger.error("%s: %s", type(ex).__name__, ex, exc_info=True)
 
@@ -330,6 +369,10 @@ def asynchronous(*, interrupted_ok: bool = False) -> Callable[[Callable[..., Awa
                         for e in loop.run_until_complete(asyncio.gather(*orphans, return_exceptions=True)):
                             if isinstance(e, BaseException) and not isinstance(e, asyncio.CancelledError):
                                 handle_task_exception(loop, {"exception": e})
+                    # Like asyncio.run(), release the resources that would otherwise outlive the loop.
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                    if sys.version_info >= (3, 9):
+                        loop.run_until_complete(loop.shutdown_default_executor())
                 finally:
                     asyncio.set_event_loop(None)
                     loop.close()
@@ -340,18 +383,72 @@ def asynchronous(*, interrupted_ok: bool = False) -> Callable[[Callable[..., Awa
 
 
 def _configure_logging(verbosity_level: int) -> None:
-    log_level = {
-        0: logging.WARNING,
-        1: logging.INFO,
-        2: logging.DEBUG,
-    }.get(verbosity_level or 0, logging.DEBUG)
+    """
+    The root logger only enqueues the records; the actual formatting and stderr I/O are done by a background
+    listener thread. This keeps slow terminal writes out of the event loop when verbose logging is enabled.
+    The listener is stopped and flushed at exit.
+    """
+    global _log_listener, _log_handler  # pylint: disable=global-statement
+    log_level = _LOG_LEVELS[min(verbosity_level or 0, len(_LOG_LEVELS) - 1)]
 
     logging.root.setLevel(log_level)
 
-    try:
-        import coloredlogs  # type: ignore
+    use_color = sys.stderr.isatty() and not sys.platform.startswith("win") and "NO_COLOR" not in os.environ
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setLevel(log_level)
+    stream_handler.setFormatter((_ColorFormatter if use_color else logging.Formatter)(_LOG_FORMAT))
 
-        # The level spec applies to the handler, not the root logger! This is different from basicConfig().
-        coloredlogs.install(level=log_level, fmt=_LOG_FORMAT)
-    except Exception as ex:  # pylint: disable=broad-except
-        _logger.exception("Could not set up coloredlogs: %r", ex)  # pragma: no cover
+    _stop_log_listener()  # In case we are invoked more than once in the same process.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_handler = logging.handlers.QueueHandler(log_queue)
+    logging.root.addHandler(_log_handler)
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    global _log_listener, _log_handler  # pylint: disable=global-statement
+    if _log_handler is not None:  # Only our own handler is removed; the handlers installed by others are kept.
+        logging.root.removeHandler(_log_handler)
+        _log_handler = None
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def _flush_log_listener() -> None:
+    """
+    Blocks until the queued log records are written out. Stopping the listener processes the remaining records,
+    and it can be restarted afterwards. This is needed to keep the log output ordered relative to the messages
+    that are written to stderr directly.
+    """
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener.start()
+
+
+_LOG_LEVELS = (logging.WARNING, logging.INFO, logging.DEBUG)
+"""Indexed by the verbosity level; higher verbosity levels are clamped to the last entry."""
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+atexit.register(_stop_log_listener)
+
+
+class _ColorFormatter(logging.Formatter):
+    """
+    Colorizes each log line according to its severity level using ANSI escape sequences.
+    """
+
+    _RESET = "\x1b[0m"
+    _LEVEL_COLORS = {
+        logging.DEBUG: "\x1b[32m",  # Green
+        logging.INFO: "",  # Default
+        logging.WARNING: "\x1b[33m",  # Yellow
+        logging.ERROR: "\x1b[31m",  # Red
+        logging.CRITICAL: "\x1b[1;31m",  # Bold red
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        color = self._LEVEL_COLORS.get(record.levelno, "")
+        return (color + text + self._RESET) if color else text
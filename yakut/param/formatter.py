@@ -4,12 +4,17 @@
 
 from __future__ import annotations
 import sys
+import functools
 import dataclasses
 import logging
-from typing import Callable, Any, cast
+from decimal import Decimal
+from typing import TYPE_CHECKING, Callable, Iterator, Any, cast
 from collections.abc import Mapping, Collection
 import click
 
+if TYPE_CHECKING:
+    from yakut.yaml import Dumper
+
 
 @dataclasses.dataclass(frozen=True)
 class FormatterHints:
@@ -38,44 +43,20 @@ def formatter_factory_option(f: Callable[..., Any]) -> Callable[..., Any]:
 
     def validate(ctx: click.Context, param: click.Parameter, value: str) -> FormatterFactory:
         try:
-            return _FORMATTERS[(override or value).upper()]
+            return _FORMATTERS[override or value]  # The choice type normalizes the case.
         except LookupError:
             raise click.BadParameter(f"Invalid format name: {value!r}", ctx=ctx, param=param) from None
 
-    doc = f"""
-The format of data printed to stdout.
-This option is only relevant for commands that produce data (sub, call, etc.).
-
-The final representation of the output data is constructed from an intermediate "builtin-based" representation,
-which is a simplified form that is stripped of the detailed DSDL type information, like JSON.
-For more info please read the PyCyphal documentation on builtin-based representations.
-
-Option "auto" (default) selects YAML if the output is shown on the terminal for the benefit of the user;
-if the output is redirected (e.g., piped to another command or to a file),
-JSON is selected to enable compatibility with jq and other 3rd-party stream processing tools.
-It helps to remember that JSON is a subset of YAML.
-
-YAML separates objects with `---`.
-JSON and TSV (tab separated values) keep exactly one object per line.
-
-TSV is intended for use with third-party software
-such as computer algebra systems or spreadsheet processors.
-
-TSVH is just TSV with the header included.
-
-TSVFC is TSVH with extra column for curly braces and square brackets. These are extra format columns that help the
-reader understand the structure of the data without looking at the headers.
-"""
     f = click.option(
         "--format",
         "-F",
         "formatter_factory",
         envvar="YAKUT_FORMAT",
-        type=click.Choice(list(_FORMATTERS.keys()), case_sensitive=False),
+        type=click.Choice(_FORMATTER_CHOICES, case_sensitive=False),
         callback=validate,
-        default=list(_FORMATTERS.keys())[0],
+        default=_FORMATTER_CHOICES[0],
         show_default=True,
-        help=doc,
+        help=_FORMAT_OPTION_HELP,
     )(f)
 
     def shortcut(opt: str) -> None:
@@ -83,7 +64,7 @@ reader understand the structure of the data without looking at the headers.
         f = click.option(
             f"--{opt}",
             "-" + opt[0],
-            flag_value=opt,
+            flag_value=opt.upper(),
             callback=install_override,
             help=f"Same as --format={opt}",
             is_eager=True,
@@ -97,52 +78,65 @@ reader understand the structure of the data without looking at the headers.
 
 
 def _make_yaml_formatter(hints: FormatterHints) -> Formatter:
+    return _get_yaml_dumper(explicit_start=not hints.single_document).dumps
+
+
+@functools.lru_cache(None)
+def _get_yaml_dumper(explicit_start: bool) -> Dumper:
+    # The dumper does not retain any state between documents, so it can be shared.
     from yakut.yaml import Dumper
 
-    dumper = Dumper(explicit_start=not hints.single_document)
-    return dumper.dumps
+    return Dumper(explicit_start=explicit_start)
 
 
 def _make_json_formatter(_hints: FormatterHints) -> Formatter:
-    # We prefer simplejson over the standard json because the native json lacks important capabilities:
-    #  - simplejson preserves dict ordering, which is very important for UX.
-    #  - simplejson supports Decimal.
-    import simplejson as json  # type: ignore
-
-    # Remove ignore_nan=True when this change makes its way into PlotJuggler:
+    # We use orjson because it is much faster than the alternatives, which matters for high-rate subjects.
+    # It preserves dict ordering, emits compact UTF-8 output, and serializes NaN/inf as null.
+    # Remove the NaN handling when this change makes its way into PlotJuggler:
     # https://github.com/nlohmann/json/issues/3799#issuecomment-1444268644
-    return (
-        lambda data: cast(
-            str,
-            json.dumps(
-                data,
-                ensure_ascii=False,
-                separators=(",", ":"),
-                ignore_nan=True,
-            ),
-        )
-        + _NEWLINE
-    )
+    import orjson
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, Decimal):
+            return orjson.Fragment(str(obj))  # Emit as a number without loss of precision.
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
+    def fallback(data: Any) -> str:
+        # orjson cannot represent integers beyond 64 bits; simplejson can, and it supports Decimal natively.
+        import simplejson  # type: ignore
 
-def _insert_format_specifier(
-    items: list[tuple[str, Any]],
-    key: str,
-    instance: Collection[Any] | Mapping[Any, Any],
-    is_start: bool = True,
-) -> None:
-    is_list = isinstance(instance, Collection) and not isinstance(instance, str)
-    is_dictionary = isinstance(instance, Mapping)
-    if is_start:
-        if is_dictionary:
-            items.append((key + "{", "{"))
-        elif is_list:
-            items.append((key + "[", "["))
-    else:
-        if is_dictionary:
-            items.append((key + "}", "}"))
-        elif is_list:
-            items.append((key + "]", "]"))
+        return cast(str, simplejson.dumps(data, ensure_ascii=False, separators=(",", ":"), ignore_nan=True))
+
+    dumps, option, error = orjson.dumps, orjson.OPT_NON_STR_KEYS, orjson.JSONEncodeError
+
+    def json_format_function(data: Any) -> str:
+        try:
+            return dumps(data, default=default, option=option).decode() + _NEWLINE
+        except error:
+            return fallback(data) + _NEWLINE
+
+    return json_format_function
+
+
+def _container_kind(v: Any) -> str:
+    """
+    Returns the opening format specifier ("{" for mappings, "[" for other collections except strings and bytes)
+    or an empty string if the value is a scalar.
+    The builtin types that dominate the builtin-based representations are checked by identity first
+    because isinstance() checks against the ABCs are several times slower.
+    """
+    ty = type(v)
+    if ty in _SCALAR_TYPES:
+        return ""
+    if ty is dict:
+        return "{"
+    if ty is list or ty is tuple:
+        return "["
+    if isinstance(v, Mapping):
+        return "{"
+    if isinstance(v, Collection) and not isinstance(v, (str, bytes, bytearray)):
+        return "["
+    return ""
 
 
 def _flatten_start(
@@ -150,36 +144,91 @@ def _flatten_start(
     parent_key: str = "",
     sep: str = ".",
     with_format_specifiers: bool = False,
-) -> dict[str, Any]:
-    def flatten(data: Any, parent_key: str = "") -> dict[str, Any]:
-        def add_item(items: list[tuple[str, Any]], new_key: str, v: Mapping[Any, Any] | Collection[Any]) -> None:
-            if with_format_specifiers:
-                _insert_format_specifier(items, new_key, v)
-            if isinstance(v, Mapping) or (isinstance(v, Collection) and not isinstance(v, str)):
-                for_extension = flatten(v, new_key)
-                if for_extension is not None:
-                    # noinspection PyTypeChecker
-                    items.extend(for_extension.items())
+) -> list[tuple[str, Any]]:
+    """
+    The traversal is iterative rather than recursive to avoid the function call overhead per nesting level.
+    Each stack frame holds the iterator over the remaining children of a container and the closing format specifier
+    item that is to be emitted once the container is exhausted (None if format specifiers are not needed).
+    """
+
+    def iter_children(data: Any, parent_key: str, kind: str) -> Iterator[tuple[str, Any]]:
+        prefix = parent_key + sep if parent_key else ""
+        if kind == "{":
+            return ((f"{prefix}{k}", v) for k, v in data.items())
+        if kind == "[":
+            return (
+                (prefix + _INDEX_KEYS[i] if i < len(_INDEX_KEYS) else f"{prefix}[{i}]", v) for i, v in enumerate(data)
+            )
+        return iter(())
+
+    items: list[tuple[str, Any]] = []
+    stack: list[tuple[Iterator[tuple[str, Any]], tuple[str, str] | None]] = [
+        (iter_children(outer, parent_key, _container_kind(outer)), None)
+    ]
+    while stack:
+        children, closer = stack[-1]
+        for new_key, v in children:
+            kind = _container_kind(v)
+            if kind:
+                if with_format_specifiers:
+                    items.append((new_key + kind, kind))
+                    end = _FORMAT_SPECIFIER_CLOSERS[kind]
+                    if (
+                        len(v) == 0
+                    ):  # Not "not v": the truth value of some collections is ambiguous, e.g., NumPy arrays.
+                        items.append((new_key + end, end))
+                        continue
+                    stack.append((iter_children(v, new_key, kind), (new_key + end, end)))
+                elif len(v) == 0:
+                    continue
+                else:
+                    stack.append((iter_children(v, new_key, kind), None))
+                break
+            items.append((new_key, v))
+        else:
+            stack.pop()
+            if closer is not None:
+                items.append(closer)
+    return items
+
+
+def _flatten_values(outer: Any, with_format_specifiers: bool = False) -> list[str]:
+    """
+    Like :func:`_flatten_start` but only the values are returned, which avoids the costly key construction.
+    This is sufficient for all rows except the header.
+    The values are converted to strings during the traversal so that the output can be joined directly.
+    """
+    out: list[str] = []
+
+    def flatten(data: Any, kind: str) -> None:
+        for v in data.values() if kind == "{" else data:
+            child_kind = _container_kind(v)
+            if child_kind:
+                if with_format_specifiers:
+                    out.append(child_kind)
+                if len(v):  # Empty containers are common (e.g., variable-length arrays); avoid the call.
+                    flatten(v, child_kind)
+                if with_format_specifiers:
+                    out.append(_FORMAT_SPECIFIER_CLOSERS[child_kind])
             else:
-                items.append((new_key, v))
-            if with_format_specifiers:
-                _insert_format_specifier(items, new_key, v, is_start=False)
-
-        if isinstance(data, Mapping):
-            items: list[tuple[str, Any]] = []
-            for k, v in data.items():
-                new_key = parent_key + sep + str(k) if parent_key else str(k)
-                add_item(items, new_key, v)
-            return dict(items)
-        if isinstance(data, Collection) and not isinstance(data, str):
-            items = []
-            for i, v in enumerate(data):
-                new_key = parent_key + sep + f"[{i}]" if parent_key else str(f"[{i}]")
-                add_item(items, new_key, v)
-            return dict(items)
-        return {}
-
-    return flatten(outer, parent_key)
+                out.append(v if isinstance(v, str) else _format_scalar(v))
+
+    outer_kind = _container_kind(outer)
+    if outer_kind:
+        flatten(outer, outer_kind)
+    return out
+
+
+def _format_scalar(v: Any) -> str:
+    """
+    Bytes (e.g., unstructured register values) are formatted as hex to keep each one in a single readable cell.
+
+    >>> _format_scalar(b"\\x01\\xff"), _format_scalar(1.5), _format_scalar("a")
+    ('01ff', '1.5', 'a')
+    """
+    if isinstance(v, (bytes, bytearray)):
+        return v.hex()
+    return str(v)
 
 
 def _make_tsv_formatter(hints: FormatterHints) -> Formatter:
@@ -188,7 +237,7 @@ def _make_tsv_formatter(hints: FormatterHints) -> Formatter:
     _ = hints  # TODO not used yet
 
     def tsv_format_function(data: Any) -> str:
-        return "\t".join(str(v) for k, v in _flatten_start(data).items()) + _NEWLINE
+        return "\t".join(_flatten_values(data)) + _NEWLINE
 
     return tsv_format_function
 
@@ -202,25 +251,16 @@ def _make_tsvh_formatter_factory(with_format_specifiers: bool) -> FormatterFacto
             nonlocal is_first_time
             if is_first_time:
                 is_first_time = False
+                items = _flatten_start(data, with_format_specifiers=with_format_specifiers)
                 return _NEWLINE.join(
                     (
-                        "\t".join(
-                            str(k)
-                            for k, v in _flatten_start(data, with_format_specifiers=with_format_specifiers).items()
-                        ),
-                        "\t".join(
-                            str(v)
-                            for k, v in _flatten_start(data, with_format_specifiers=with_format_specifiers).items()
-                        ),
+                        "\t".join([k for k, _ in items]),
+                        "\t".join([_format_scalar(v) for _, v in items]),
                         "",
                     )
                 )
-            return (
-                "\t".join(
-                    str(v) for k, v in _flatten_start(data, with_format_specifiers=with_format_specifiers).items()
-                )
-                + _NEWLINE
-            )
+            # The header is only needed once, so the keys need not be constructed for the subsequent rows.
+            return "\t".join(_flatten_values(data, with_format_specifiers)) + _NEWLINE
 
         return tsv_format_function_with_header
 
@@ -228,7 +268,13 @@ def _make_tsvh_formatter_factory(with_format_specifiers: bool) -> FormatterFacto
 
 
 def _make_auto(hints: FormatterHints) -> Formatter:
-    fac = _make_yaml_formatter if sys.stdout.isatty() else _make_json_formatter
+    return _make_auto_for_tty(sys.stdout.isatty(), hints)
+
+
+@functools.lru_cache(None)
+def _make_auto_for_tty(is_tty: bool, hints: FormatterHints) -> Formatter:
+    # The selected formatters are stateless so the instances can be shared. The hints are hashable (frozen).
+    fac = _make_yaml_formatter if is_tty else _make_json_formatter
     _logger.debug("Automatically selected formatter: %r", fac)
     return fac(hints)
 
@@ -241,9 +287,39 @@ _FORMATTERS = {
     "TSVH": _make_tsvh_formatter_factory(with_format_specifiers=False),
     "TSVFC": _make_tsvh_formatter_factory(with_format_specifiers=True),
 }
+_FORMATTER_CHOICES = tuple(_FORMATTERS.keys())  # The first one is the default.
 
 _NEWLINE = "\n"
 
+_FORMAT_OPTION_HELP = """
+The format of data printed to stdout.
+This option is only relevant for commands that produce data (sub, call, etc.).
+
+The final representation of the output data is constructed from an intermediate "builtin-based" representation,
+which is a simplified form that is stripped of the detailed DSDL type information, like JSON.
+For more info please read the PyCyphal documentation on builtin-based representations.
+
+Option "auto" (default) selects YAML if the output is shown on the terminal for the benefit of the user;
+if the output is redirected (e.g., piped to another command or to a file),
+JSON is selected to enable compatibility with jq and other 3rd-party stream processing tools.
+It helps to remember that JSON is a subset of YAML.
+
+YAML separates objects with `---`.
+JSON and TSV (tab separated values) keep exactly one object per line.
+
+TSV is intended for use with third-party software
+such as computer algebra systems or spreadsheet processors.
+
+TSVH is just TSV with the header included.
+
+TSVFC is TSVH with extra column for curly braces and square brackets. These are extra format columns that help the
+reader understand the structure of the data without looking at the headers.
+"""
+
+_SCALAR_TYPES = frozenset({int, float, bool, str, bytes, type(None), Decimal})
+_FORMAT_SPECIFIER_CLOSERS = {"{": "}", "[": "]"}
+_INDEX_KEYS = tuple(f"[{i}]" for i in range(256))
+
 _logger = logging.getLogger(__name__)
 
 
@@ -268,13 +344,21 @@ def _unittest_formatter() -> None:
 """
     )
     assert _FORMATTERS["JSON"](default_hints)(obj) == '{"2345":{"abc":{"def":[123,456]},"ghi":789}}\n'
+    assert _FORMATTERS["JSON"](default_hints)({"a": [2**70, 1.5]}) == '{"a":[1180591620717411303424,1.5]}\n'
     assert _FORMATTERS["TSV"](default_hints)(obj) == "123\t456\t789\n"
     tsvh_formatter = _FORMATTERS["TSVH"](default_hints)
     # first time should include a header
     assert tsvh_formatter(obj) == "2345.abc.def.[0]\t2345.abc.def.[1]\t2345.ghi\n123\t456\t789\n"
     # subsequent calls shouldn't include a header
     assert tsvh_formatter(obj) == "123\t456\t789\n"
-    from decimal import Decimal
+    assert _FORMATTERS["TSV"](default_hints)({"a": b"\x01\xab", "b": [1]}) == "01ab\t1\n"
+    assert _FORMATTERS["TSVH"](default_hints)({"a": bytearray(b"\xcd")}) == "a\ncd\n"
+    assert _FORMATTERS["TSVFC"](default_hints)({"a": [], "b": 1}) == "a[\ta]\tb\n[\t]\t1\n"
+    import numpy as np  # The truth value of an array is ambiguous, so it cannot be used to check for emptiness.
+
+    arrays = {"a": np.array([1, 2]), "b": np.array([])}
+    assert _FORMATTERS["TSV"](default_hints)(arrays) == "1\t2\n"
+    assert _FORMATTERS["TSVFC"](default_hints)(arrays) == "a[\ta.[0]\ta.[1]\ta]\tb[\tb]\n[\t1\t2\t]\t[\t]\n"
     from math import nan
 
     obj = {
@@ -313,6 +397,10 @@ def _unittest_formatter() -> None:
         "	{	309697890	}	{	{	{	nan	}	{	0.0	}"
         "	{	0.0	}	}	{	nan	}	}	}\n"
     )
+    assert (
+        tsvfc_formatter(obj) == "{	{	{	1640611164.396007	4765.594161	}	nominal	28	21	}"
+        "	{	309697890	}	{	{	{	nan	}	{	0.0	}	{	0.0	}	}	{	nan	}	}	}\n"
+    )
     assert (
         _FORMATTERS["TSV"](default_hints)(obj)
         == "1640611164.396007\t4765.594161\tnominal\t28\t21\t309697890\tnan\t0.0\t0.0\tnan\n"
@@ -23,6 +23,8 @@ from yakut.enum_param import EnumParam
 if typing.TYPE_CHECKING:
     import pycyphal.application  # pylint: disable=ungrouped-imports
 
+_RE_NAME_SUFFIX = re.compile(r"[a-z][a-z0-9_]*[a-z0-9]")
+
 _logger = logging.getLogger(__name__)
 
 
@@ -58,7 +60,7 @@ class NodeFactory:
         from yakut import Purser
 
         _logger.debug("Constructing node using %r with %r and name %r", self, transport, name_suffix)
-        if not re.match(r"[a-z][a-z0-9_]*[a-z0-9]", name_suffix):  # pragma: no cover
+        if not _RE_NAME_SUFFIX.match(name_suffix):  # pragma: no cover
             raise ValueError(f"Internal error: Poorly chosen node name suffix: {name_suffix!r}")
 
         try:
@@ -233,28 +235,32 @@ def _register_output_transfer_id_map_save_at_exit(presentation: pycyphal.present
     _logger.debug("Output TID map file for %s: %s", presentation.transport, path)
 
     def do_save_at_exit() -> None:
-        if path is not None:
+        # An empty map means that nothing was restored and nothing was sent, so there is nothing worth saving.
+        # A non-empty map is saved even if unchanged to refresh the modification time of the file.
+        if path is not None and presentation.output_transfer_id_map:
             tmp = f"{path}.{os.getpid()}.{time.time_ns()}.tmp"
             _logger.debug("Output TID map save: %s --> %s", tmp, path)
+            # The map is small, so serialize it in memory and emit it using a single write.
+            data = pickle.dumps(presentation.output_transfer_id_map, protocol=pickle.HIGHEST_PROTOCOL)
+            path.parent.mkdir(parents=True, exist_ok=True)  # Only needed for writing; a missing file is not an error.
             with open(tmp, "wb") as f:
-                pickle.dump(presentation.output_transfer_id_map, f)
+                f.write(data)
             # We use replace for compatibility reasons. On POSIX, a call to rename() will be made, which is
             # guaranteed to be atomic. On Windows this may fall back to non-atomic copy, which is still
             # acceptable for us here. If the file ends up being damaged, we'll simply ignore it at next startup.
             os.replace(tmp, str(path))
-            try:
-                os.unlink(tmp)
-            except OSError:
-                pass
+            if os.name == "nt":  # On POSIX, the rename always consumes the temporary file.
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
 
     atexit.register(do_save_at_exit)
 
 
 def _get_output_transfer_id_map_path(transport: Transport) -> typing.Optional[pathlib.Path]:
     if transport.local_node_id is not None:
-        path = OUTPUT_TRANSFER_ID_MAP_DIR / str(transport.local_node_id)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        return path
+        return OUTPUT_TRANSFER_ID_MAP_DIR / str(transport.local_node_id)
     return None
 
 
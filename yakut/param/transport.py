@@ -3,9 +3,10 @@
 # Author: Pavel Kirienko <pavel@opencyphal.org>
 
 from __future__ import annotations
-from typing import Callable, Optional, Any, List, Dict
-import inspect
+from typing import Callable, Optional, Any, List, Dict, FrozenSet
 import logging
+import functools
+from types import CodeType, ModuleType
 import pycyphal
 from pycyphal.transport import Transport as Transport
 import click
@@ -52,7 +53,20 @@ def transport_factory_option(f: Callable[..., Any]) -> Callable[..., Any]:
 
         return factory
 
-    doc = f"""
+    f = click.option(
+        "--transport",
+        "-i",
+        "transport_factory",
+        envvar="YAKUT_TRANSPORT",
+        type=str,
+        metavar="EXPRESSION",
+        callback=validate,
+        help=_TRANSPORT_OPTION_HELP,
+    )(f)
+    return f
+
+
+_TRANSPORT_OPTION_HELP = f"""
 Override the network interface configuration, including the local node-ID.
 This option is only relevant for commands that access the network, like pub/sub/call/etc.; other commands ignore it.
 
@@ -90,21 +104,11 @@ On this computer, the path is `{OUTPUT_TRANSFER_ID_MAP_DIR}`.
 The map files can be removed to reset all transfer-ID counters to zero.
 Files that are more than {OUTPUT_TRANSFER_ID_MAP_MAX_AGE} seconds old are not used.
 """
-    f = click.option(
-        "--transport",
-        "-i",
-        "transport_factory",
-        envvar="YAKUT_TRANSPORT",
-        type=str,
-        metavar="EXPRESSION",
-        callback=validate,
-        help=doc,
-    )(f)
-    return f
 
 
 def construct_transport(expression: str) -> Transport:
-    context = _make_evaluation_context()
+    names = _collect_referenced_names(_compile_transport_expr(expression))
+    context = dict(_make_evaluation_context(names))  # Copy because eval() mutates the globals (adds __builtins__).
     trs = _evaluate_transport_expr(expression, context)
     _logger.debug("Transport expression evaluation result: %r", trs)
     if len(trs) == 1:
@@ -121,7 +125,7 @@ def construct_transport(expression: str) -> Transport:
 
 
 def _evaluate_transport_expr(expression: str, context: Dict[str, Any]) -> List[Transport]:
-    out = eval(expression, context)
+    out = eval(_compile_transport_expr(expression), context)
     if isinstance(out, Transport):
         return [out]
     if isinstance(out, (list, tuple)) and all(isinstance(x, Transport) for x in out):
@@ -132,8 +136,33 @@ def _evaluate_transport_expr(expression: str, context: Dict[str, Any]) -> List[T
     )
 
 
-def _make_evaluation_context() -> Dict[str, Any]:
+@functools.lru_cache(None)
+def _compile_transport_expr(expression: str) -> CodeType:
+    return compile(expression, "<transport expression>", "eval")
+
+
+def _collect_referenced_names(code: CodeType) -> FrozenSet[str]:
+    """
+    Returns all names referenced by the code object, including nested scopes like comprehensions and lambdas.
+    """
+    out = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            out |= _collect_referenced_names(const)
+    return frozenset(out)
+
+
+@functools.lru_cache(None)
+def _make_evaluation_context(names: FrozenSet[str]) -> Dict[str, Any]:
+    """
+    Only the transport packages referenced by the expression are imported (e.g., ``UDP``, ``CANTransport``, ``can``),
+    unless it refers to the ``pycyphal`` package directly, in which case everything is imported.
+    The result is cached because the context is constructed via costly reflection and it never changes.
+    The caller shall not mutate the returned mapping.
+    """
     import os
+    import pkgutil
+    import importlib
 
     def handle_import_error(parent_module_name: str, ex: ImportError) -> None:
         try:
@@ -142,10 +171,24 @@ def _make_evaluation_context() -> Dict[str, Any]:
             tr = parent_module_name
         _logger.debug("Transport %r is not available due to the missing dependency %r", tr, ex.name)
 
-    # This import is super slow, so we do it as late as possible.
+    packages = {
+        x.name for x in pkgutil.iter_modules(pycyphal.transport.__path__) if x.ispkg and not x.name.startswith("_")
+    }
+    if "pycyphal" not in names:
+        suffix = Transport.__name__
+        packages &= {(x[: -len(suffix)] if x.endswith(suffix) else x).lower() for x in names}
+
+    # This import is super slow, so we do it as late as possible and only for the transports that are needed.
     # Doing this when generating command-line arguments would be disastrous for performance.
-    # noinspection PyTypeChecker
-    pycyphal.util.import_submodules(pycyphal.transport, error_handler=handle_import_error)
+    for pkg_name in sorted(packages):
+        full_name = f"{pycyphal.transport.__name__}.{pkg_name}"
+        try:
+            pkg = importlib.import_module(full_name)
+        except ImportError as ex:
+            handle_import_error(full_name, ex)
+            continue
+        # noinspection PyTypeChecker
+        pycyphal.util.import_submodules(pkg, error_handler=handle_import_error)
 
     # Populate the context with all references that may be useful for the transport expression.
     context: Dict[str, Any] = {
@@ -154,8 +197,8 @@ def _make_evaluation_context() -> Dict[str, Any]:
     }
 
     # Expose pre-imported transport modules for convenience.
-    for name, module in inspect.getmembers(pycyphal.transport, inspect.ismodule):
-        if not name.startswith("_"):
+    for name, module in vars(pycyphal.transport).items():
+        if not name.startswith("_") and isinstance(module, ModuleType):
             context[name] = module
 
     # Pre-import transport classes.
@@ -168,3 +211,20 @@ def _make_evaluation_context() -> Dict[str, Any]:
 
     _logger.debug("Transport expression evaluation context (on the next line):\n%r", context)
     return context
+
+
+def _unittest_construct_transport() -> None:
+    from pycyphal.transport.loopback import LoopbackTransport
+    from pycyphal.transport.redundant import RedundantTransport
+
+    names = _collect_referenced_names(_compile_transport_expr("[UDP(x, n) for n in range(Serial)]"))
+    assert {"UDP", "range", "Serial"} <= names
+
+    tr = construct_transport("Loopback(123)")
+    assert isinstance(tr, LoopbackTransport)
+    assert tr.local_node_id == 123
+
+    tr = construct_transport("[LoopbackTransport(123) for _ in range(2)]")
+    assert isinstance(tr, RedundantTransport)
+    assert len(tr.inferiors) == 2
+    tr.close()
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING, Callable, Optional
+import asyncio
 import logging
 import pycyphal
 from yakut.util import METADATA_KEY
@@ -29,42 +30,66 @@ async def fetch_registers(
     from pycyphal.application.register import ValueProxy as RegisterValue
     from uavcan.register import Access_1, List_1, Name_1
 
-    # Fetch register names.
     c_list = presentation.make_client_with_fixed_service_id(List_1, node_id)
     c_list.response_timeout = timeout
     c_list.priority = priority
-    names: list[str] = []
-    while True:
-        req: Any = List_1.Request(len(names))
-        resp = await c_list(req)
-        if resp is None:
-            _logger.warning("Request to %r has timed out: %s", node_id, req)
-            return None
-        assert isinstance(resp, List_1.Response)
-        if not resp.name.name.tobytes():
-            break
-        names.append(resp.name.name.tobytes().decode())
-    _logger.debug("Register names fetched from node %r: %s", node_id, names)
-    c_list.close()
-    del c_list
-
-    names = list(filter(predicate, names))
-
-    # Then fetch the registers themselves.
     c_access = presentation.make_client_with_fixed_service_id(Access_1, node_id)
     c_access.response_timeout = timeout
     c_access.priority = priority
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    timed_out = False
+
+    async def fetch_one(req: Access_1.Request) -> Access_1.Response | None:
+        nonlocal timed_out
+        async with semaphore:
+            if timed_out:  # Do not bother sending the remaining requests if the node has stopped responding.
+                return None
+            resp = await c_access(req)
+            if resp is None:
+                _logger.warning("Request to %r has timed out: %s", node_id, req)
+                timed_out = True
+                return None
+            assert isinstance(resp, Access_1.Response)
+            return resp
+
+    # The register names are fetched in batches because the total number is not known in advance: the indexes are
+    # probed until an empty name is returned; the requests past the end are harmless.
+    # Unlike the list requests, the access requests are independent of each other, so the registers are fetched
+    # in the background while the following names are still being listed.
+    # The concurrency is limited to avoid overrunning the request queue of the server and to stay within the
+    # transfer-ID variability of transports like CAN.
+    names: list[str] = []
+    pending: dict[str, asyncio.Future[Access_1.Response | None]] = {}
+    try:
+        done = False
+        while not done:
+            reqs: list[Any] = [List_1.Request(len(names) + i) for i in range(_MAX_CONCURRENT_REQUESTS)]
+            for req, resp in zip(reqs, await asyncio.gather(*map(c_list, reqs))):
+                if resp is None:
+                    _logger.warning("Request to %r has timed out: %s", node_id, req)
+                    return None
+                assert isinstance(resp, List_1.Response)
+                name = resp.name.name.tobytes()
+                if not name:
+                    done = True
+                    break
+                nm = name.decode()
+                names.append(nm)
+                if nm not in pending and predicate(nm):
+                    pending[nm] = asyncio.ensure_future(fetch_one(Access_1.Request(name=Name_1(name))))
+        _logger.debug("Register names fetched from node %r: %s", node_id, names)
+        responses = await asyncio.gather(*pending.values())
+    finally:
+        for fut in pending.values():
+            fut.cancel()
+        c_list.close()
+        c_access.close()
+
     regs: dict[str, RegisterValue] = {}
-    for nm in names:
-        req = Access_1.Request(name=Name_1(nm))
-        resp = await c_access(req)
+    for nm, resp in zip(pending, responses):
         if resp is None:
-            _logger.warning("Request to %r has timed out: %s", node_id, req)
             return None
-        assert isinstance(resp, Access_1.Response)
         regs[nm] = RegisterValue(resp.value)
-    c_access.close()
-
     return regs
 
 
@@ -177,9 +202,15 @@ def _simplify_value(msg: "Value") -> Any:
         return msg.unstructured.value.tobytes()
     if msg.string:
         return msg.string.value.tobytes().decode(errors="replace")
-    ((_ty, val),) = pycyphal.dsdl.to_builtin(msg).items()
-    val = val["value"]
-    val = list(val.encode() if isinstance(val, str) else val)
+    # The remaining options are numerical arrays. Take the active one directly instead of converting the whole
+    # union via to_builtin(), which is costly for long arrays.
+    for field in pycyphal.dsdl.get_model(msg).fields_except_padding:
+        member = getattr(msg, field.name)
+        if member is not None:
+            break
+    else:  # pragma: no cover
+        raise ValueError(f"No active field in {msg}")
+    val = member.value.tolist()
     if len(val) == 1:  # One-element arrays shown as scalars.
         (val,) = val
     return val
@@ -195,4 +226,6 @@ def get_access_response_metadata(val: "Access_1.Response") -> dict[str, Any]:
     }
 
 
+_MAX_CONCURRENT_REQUESTS = 8
+
 _logger = logging.getLogger(__name__)
@@ -25,11 +25,10 @@ class SubjectResolver:
         self._local_node = local_node
         self._reg_cache: dict[int, dict[str, ValueProxy] | None] = {}
         self._seen_nodes: set[int] = set()
+        self._new_node_event = asyncio.Event()
         self._sub_heart = self._local_node.make_subscriber(Heartbeat_1)
         self._sub_heart.transport_session.transfer_id_timeout = 1e-3
-        self._sub_heart.receive_in_background(
-            lambda _, meta: self._seen_nodes.add(meta.source_node_id) if meta.source_node_id is not None else None
-        )
+        self._sub_heart.receive_in_background(self._on_heartbeat)
         self._node_discovery_deadline = asyncio.get_running_loop().time() + SubjectResolver._DISCOVERY_TIMEOUT
 
     async def dtypes_by_id(self, subject_id: int) -> set[str]:
@@ -46,27 +45,35 @@ class SubjectResolver:
 
     async def _update_reg_cache(self) -> None:
         while True:
-            remaining = self._seen_nodes - set(self._reg_cache.keys())
+            remaining = sorted(self._seen_nodes - self._reg_cache.keys())
+            if remaining:
+                # The nodes are queried concurrently because each of them is a separate server.
+                results = await asyncio.gather(*map(self._fetch_registers, remaining))
+                self._reg_cache.update(zip(remaining, results))
+                continue
+            # Wait for new nodes to come up online, if any.
+            self._new_node_event.clear()
+            timeout = self._node_discovery_deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
             try:
-                nid = next(iter(remaining))
-            except StopIteration:
-                if asyncio.get_running_loop().time() > self._node_discovery_deadline:
-                    break
-                await asyncio.sleep(0.1)  # Wait for new nodes to come up online, if any.
-            else:
-                self._reg_cache[nid] = await fetch_registers(
-                    self._local_node.presentation,
-                    nid,
-                    predicate=lambda name: any(
-                        x.match(name)
-                        for x in [
-                            _REGEX_REG_PUBSUB_NAME_ID,
-                            _REGEX_REG_PUBSUB_NAME_TYPE,
-                        ]
-                    ),
-                    timeout=SubjectResolver._RESPONSE_TIMEOUT,
-                    priority=pycyphal.transport.Priority.HIGH,
-                )
+                await asyncio.wait_for(self._new_node_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                break
+
+    def _on_heartbeat(self, _msg: object, meta: pycyphal.transport.TransferFrom) -> None:
+        if meta.source_node_id is not None and meta.source_node_id not in self._seen_nodes:
+            self._seen_nodes.add(meta.source_node_id)
+            self._new_node_event.set()
+
+    async def _fetch_registers(self, node_id: int) -> dict[str, "pycyphal.application.register.ValueProxy"] | None:
+        return await fetch_registers(
+            self._local_node.presentation,
+            node_id,
+            predicate=lambda name: _REGEX_REG_PUBSUB_NAME.fullmatch(name) is not None,
+            timeout=SubjectResolver._RESPONSE_TIMEOUT,
+            priority=pycyphal.transport.Priority.HIGH,
+        )
 
     def close(self) -> None:
         """
@@ -75,8 +82,7 @@ class SubjectResolver:
         self._sub_heart.close()
 
 
-_REGEX_REG_PUBSUB_NAME_ID = re.compile(r"uavcan\.(pub|sub)\.(.+)\.id")
-_REGEX_REG_PUBSUB_NAME_TYPE = re.compile(r"uavcan\.(pub|sub)\.(.+)\.type")
+_REGEX_REG_PUBSUB_NAME = re.compile(r"uavcan\.(pub|sub)\.(.+)\.(id|type)")
 
 
 def _register_dtypes_by_id(
@@ -85,27 +91,32 @@ def _register_dtypes_by_id(
 ) -> set[str]:
     from pycyphal.application.register import ValueConversionError
 
-    result: set[str] = set()
-    names: dict[int, str] = {}
+    # Collect the port-IDs and type names in one pass keyed by (node-ID, port name), then join them.
+    port_ids: dict[tuple[int, str], int] = {}
+    type_names: dict[tuple[int, str], tuple[str, "pycyphal.application.register.ValueProxy"]] = {}
     for node_id, registers in registers_per_node.items():
         for reg_name, reg_val in registers.items():
-            match = _REGEX_REG_PUBSUB_NAME_ID.match(reg_name)
-            if match:
-                _pubsub, port_name = match.groups()
-                try:
-                    if int(reg_val) == subject_id:
-                        names[node_id] = port_name
-                except ValueConversionError:
-                    _logger.warning("Register %r@%r contains an invalid port-ID value %r", reg_name, node_id, reg_val)
-    _logger.debug("Names of subject %r per node: %r", subject_id, names)
-    for node_id, port_name in names.items():
-        for reg_name, reg_val in registers_per_node[node_id].items():
-            match = _REGEX_REG_PUBSUB_NAME_TYPE.match(reg_name)
-            if match and match.group(2) == port_name:
-                try:
-                    result.add(str(reg_val))
-                except ValueConversionError:
-                    _logger.warning("Register %r@%r contains an invalid data type name %r", reg_name, node_id, reg_val)
+            match = _REGEX_REG_PUBSUB_NAME.fullmatch(reg_name)
+            if not match:
+                continue
+            _pubsub, port_name, kind = match.groups()
+            if kind == "type":
+                type_names[node_id, port_name] = reg_name, reg_val
+                continue
+            try:
+                port_ids[node_id, port_name] = int(reg_val)
+            except ValueConversionError:
+                _logger.warning("Register %r@%r contains an invalid port-ID value %r", reg_name, node_id, reg_val)
+    _logger.debug("Port-IDs per node and port name: %r", port_ids)
+    result: set[str] = set()
+    for (node_id, port_name), port_id in port_ids.items():
+        if port_id != subject_id or (node_id, port_name) not in type_names:
+            continue
+        reg_name, reg_val = type_names[node_id, port_name]
+        try:
+            result.add(str(reg_val))
+        except ValueConversionError:
+            _logger.warning("Register %r@%r contains an invalid data type name %r", reg_name, node_id, reg_val)
     return result
 
 
@@ -133,6 +144,9 @@ def _unittest_register_dtypes_by_id() -> None:
             # bad type
             "uavcan.pub.bad_type.id": ValueProxy(Natural16([2000])),
             "uavcan.pub.bad_type.type": ValueProxy(Natural16([2000])),
+            # not a port register despite the prefix
+            "uavcan.pub.suffixed.id.extra": ValueProxy(Natural16([9000])),
+            "uavcan.pub.suffixed.type": ValueProxy(String("ns.S.1.0")),
         },
         1: {
             "uavcan.sub.cc.id": ValueProxy(Natural16([2000])),
@@ -141,8 +155,15 @@ def _unittest_register_dtypes_by_id() -> None:
             "uavcan.pub.aa.type": ValueProxy(String("ns.A.2.2")),
         },
         3: {},
+        4: {
+            "uavcan.pub.m.id": ValueProxy(Natural16([5000])),
+            "uavcan.pub.m.type": ValueProxy(String("ns.M.1.0")),
+            "uavcan.sub.n.id": ValueProxy(Natural16([5000])),
+            "uavcan.sub.n.type": ValueProxy(String("ns.N.1.0")),
+        },
     }
     assert _register_dtypes_by_id(regs, 1000) == {"ns.A.1.1", "ns.A.2.2"}
     assert _register_dtypes_by_id(regs, 2000) == {"ns.B.1.1"}  # Bad type ignored.
     assert _register_dtypes_by_id(regs, 3000) == set()  # Typeless ignored.
+    assert _register_dtypes_by_id(regs, 5000) == {"ns.M.1.0", "ns.N.1.0"}  # Multiple ports per node.
     assert _register_dtypes_by_id(regs, 9000) == set()  # Not found
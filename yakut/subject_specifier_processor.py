@@ -63,8 +63,8 @@ async def process_subject_specifier(
     _logger.info("Subject specifier is a number (%r), using network resolver (this may take a few seconds)", subject_id)
     assert isinstance(subject_id, int)
     resolver = resolver_provider()
-    # Sorting to bubble newer types higher up. This should be natural sort.
-    type_names = list(sorted(await resolver.dtypes_by_id(subject_id), reverse=True))
+    # Sorting to bubble newer types higher up.
+    type_names = sorted(await resolver.dtypes_by_id(subject_id), key=_natural_sort_key, reverse=True)
     _logger.debug("Dtype names found by the network resolver for subject-ID %s: %s", subject_id, type_names)
     try:
         dtype = next(
@@ -94,4 +94,17 @@ def _parse_subject_id(spec: str) -> int | None:
     return None
 
 
+def _natural_sort_key(name: str) -> tuple[tuple[bool, int | str], ...]:
+    """
+    Splits the data type name into components such that the version numbers are compared numerically.
+    Numeric components sort before non-numeric ones, so arbitrary strings received from the network are comparable.
+
+    >>> sorted(["ns.A.10.0", "ns.A.2.0", "ns.A.2.10", "ns.A.2.9"], key=_natural_sort_key)
+    ['ns.A.2.0', 'ns.A.2.9', 'ns.A.2.10', 'ns.A.10.0']
+    >>> sorted(["ns.1", "ns.a"], key=_natural_sort_key)
+    ['ns.1', 'ns.a']
+    """
+    return tuple((False, int(x)) if x.isdecimal() else (True, x) for x in name.split("."))
+
+
 _logger = yakut.get_logger(__name__)
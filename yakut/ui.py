@@ -41,7 +41,9 @@ class ProgressReporter:
 
 def _mk_impl() -> ProgressCallback:
     if sys.stderr.isatty():
-        return lambda text: click.secho(f"\r{text}\r", nl=False, file=sys.stderr, fg="green")
+        # Style a placeholder once and reuse the escape sequences instead of restyling the text on every update.
+        head, tail = click.style("\r\0\r", fg="green").split("\0")
+        return lambda text: click.echo(head + text + tail, nl=False, file=sys.stderr)
     return lambda _: None
 
 
@@ -24,11 +24,15 @@ def compose(*fs: Callable[..., T]) -> Callable[..., T]:
     >>> compose(lambda x: x+2, lambda x: x*2)(3)
     10
     """
-    return functools.reduce(_compose_unit, fs[::-1])
+    first, *rest = fs  # The first function receives the arguments; the last one produces the result.
 
+    def composed(*a: Any, **kw: Any) -> T:
+        out = first(*a, **kw)
+        for f in rest:
+            out = f(out)
+        return out
 
-def _compose_unit(f: Callable[..., T], g: Callable[..., T]) -> Callable[..., T]:
-    return lambda *a, **kw: f(g(*a, **kw))
+    return composed
 
 
 def convert_transfer_metadata_to_builtin(
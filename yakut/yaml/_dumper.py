@@ -85,3 +85,9 @@ def:
   qqq: 123
 """
     )
+    # Null values are emitted as empty scalars in block mappings; leaf mappings keep the flow style even if they
+    # contain multi-line strings, which are emitted on one line.
+    ref = Dumper().dumps({"m": {"source_node_id": None, "s": "a\nb", "t": "x"}, "n": None, "l": [None, "c\nd"]})
+    assert ref == 'm: {source_node_id: null, s: "a\\nb", t: x}\nn:\nl: [null, "c\\nd"]\n'
+    ref = Dumper(prefer_block_style=True).dumps({"m": {"source_node_id": None, "s": "a\nb"}})
+    assert ref == 'm:\n  source_node_id:\n  s: "a\\nb"\n'
@@ -5,6 +5,9 @@
 from __future__ import annotations
 from typing import Any, Dict, Callable, TextIO
 import time
+import builtins
+import logging
+import weakref
 import ruamel.yaml
 import ruamel.yaml.constructor
 import yakut
@@ -35,7 +38,7 @@ class EvaluableLoader(Loader):
         super().__init__()
         self._evaluation_context = evaluation_context.copy()
 
-        class ConstructorWrapper(ruamel.yaml.constructor.RoundTripConstructor):  # type: ignore
+        class ConstructorWrapper(ruamel.yaml.constructor.SafeConstructor):  # type: ignore
             """
             New class to avoid global state: https://stackoverflow.com/questions/67041211
             """
@@ -68,24 +71,12 @@ class EvaluableLoader(Loader):
         The result of that closure is the evaluated document.
         This way allows you to evaluate the same document with different arguments without re-parsing it from scratch.
         """
-        root = self._impl.load(text)
+        root = _compile(self._impl.load(text))
 
         def evaluate(**kw: Any) -> Any:
-            ctx = self._evaluation_context.copy()
-            ctx.update(kw)
-
-            def traverse(obj: Any) -> Any:
-                if isinstance(obj, dict):
-                    return {key: traverse(value) for key, value in obj.items()}
-                if isinstance(obj, (list, tuple, set)):
-                    return list(map(traverse, obj))
-                if isinstance(obj, (bool, int, float, str, bytes)) or obj is None:
-                    return obj
-                if isinstance(obj, EmbeddedExpression):
-                    return obj.evaluate(ctx)
-                raise TypeError(f"Unexpected object type: {type(obj).__name__}")  # pragma: no cover
-
-            return traverse(root)
+            # The builtins are added explicitly; otherwise, eval() would insert them into the copy on every call.
+            ctx = {"__builtins__": builtins, **self._evaluation_context, **kw}
+            return root(ctx)
 
         return evaluate
 
@@ -95,11 +86,15 @@ class EmbeddedExpression:
     An evaluable expression embedded into a YAML document.
     """
 
+    __slots__ = ("_source_text", "_code", "__weakref__")
+
     def __init__(self, source_text: str) -> None:
         self._source_text = source_text
         self._code = compile(self._source_text, "<embedded-yaml-expression>", "eval")
 
     def evaluate(self, evaluation_context: Dict[str, Any]) -> Any:
+        if not _logger.isEnabledFor(logging.DEBUG):  # Skip the timing in the common case, this is a hot path.
+            return eval(self._code, evaluation_context)
         started_at = time.monotonic()
         result = eval(self._code, evaluation_context)
         elapsed = time.monotonic() - started_at
@@ -110,14 +105,53 @@ class EmbeddedExpression:
         return repr(self._source_text)
 
 
+def _compile(obj: Any) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Converts the loaded document into a tree of closures that construct the evaluated document
+    when invoked with the evaluation context.
+    This way, the type dispatch and the iteration over the loaded containers are done only once per document
+    rather than on every evaluation.
+    Every evaluation returns new containers, so the caller may mutate the result; only the scalars are shared.
+    """
+    if isinstance(obj, EmbeddedExpression):
+        return obj.evaluate
+    if isinstance(obj, dict):
+        if all(map(_is_scalar, obj.values())):  # Leaf mappings are copied without the per-item closure calls.
+            items = dict(obj)
+            return lambda _: items.copy()
+        funs = [(key, _compile(value)) for key, value in obj.items()]
+        return lambda ctx: {key: fun(ctx) for key, fun in funs}
+    if isinstance(obj, (list, tuple, set)):
+        if all(map(_is_scalar, obj)):
+            elements = list(obj)
+            return lambda _: elements.copy()
+        element_funs = list(map(_compile, obj))
+        return lambda ctx: [fun(ctx) for fun in element_funs]
+    if _is_scalar(obj):
+        return _constant(obj)
+    raise TypeError(f"Unexpected object type: {type(obj).__name__}")  # pragma: no cover
+
+
+def _is_scalar(obj: Any) -> bool:
+    return isinstance(obj, (bool, int, float, str, bytes)) or obj is None
+
+
+def _constant(value: Any) -> Callable[[Dict[str, Any]], Any]:
+    return lambda _: value
+
+
 def construct_embedded_expression(_constructor: ruamel.yaml.Constructor, node: ruamel.yaml.Node) -> EmbeddedExpression:
     _logger.debug("Loading embedded expression from node %r", node)
     if not isinstance(node, ruamel.yaml.ScalarNode) or not isinstance(node.value, str):
         raise EmbeddedExpressionError("Embedded expression must be a YAML string")
-    try:
-        out = EmbeddedExpression(node.value)
-    except Exception as ex:
-        raise EmbeddedExpressionError(f"Could not load embedded expression from node {node}: {ex}") from ex
+    # The expressions are immutable, so identical ones can share the same instance and be compiled only once.
+    out = _EXPRESSIONS.get(node.value)
+    if out is None:
+        try:
+            out = EmbeddedExpression(node.value)
+        except Exception as ex:
+            raise EmbeddedExpressionError(f"Could not load embedded expression from node {node}: {ex}") from ex
+        _EXPRESSIONS[node.value] = out
     _logger.debug("Successfully constructed embedded expression: %s", out)
     return out
 
@@ -126,6 +160,11 @@ def catch_unknown_tags(_constructor: ruamel.yaml.Constructor, tag: str, node: ru
     raise ValueError(f"Unsupported YAML tag {tag!r} encountered in node {node!r}")
 
 
+_EXPRESSIONS: weakref.WeakValueDictionary[str, EmbeddedExpression] = weakref.WeakValueDictionary()
+"""
+Maps the source text to the live expression instance. Entries disappear when the loaded documents are discarded.
+"""
+
 _logger = yakut.get_logger(__name__)
 
 
@@ -145,6 +184,26 @@ def _unittest_eval() -> None:
     loader.evaluation_context["one"] = 11
     loader.evaluation_context["two"] = 222
     assert evaluator(three=-3) == [11, 222, -3]
+    assert "__builtins__" not in loader.evaluation_context
+
+    evaluator = loader.load_unevaluated("{a: [1, {b: 2}], c: [3, !$ three]}")
+    assert evaluator(three=3) == {"a": [1, {"b": 2}], "c": [3, 3]}
+    assert evaluator(three=4) == {"a": [1, {"b": 2}], "c": [3, 4]}
+    out = evaluator(three=0)  # Mutating one result does not affect the subsequent evaluations.
+    out["a"][1]["b"] = 20
+    out["a"].append(5)
+    out["c"][0] = 30
+    out["d"] = 6
+    assert evaluator(three=0) == {"a": [1, {"b": 2}], "c": [3, 0]}
+    evaluator = loader.load_unevaluated("{a: [1, {b: 2}]}")
+    out = evaluator()
+    out["a"][1].clear()
+    assert evaluator() == {"a": [1, {"b": 2}]}
+
+    exprs = loader._impl.load("[!$ one, !$ one, !$ two]")  # pylint: disable=protected-access
+    assert exprs[0] is exprs[1] is _EXPRESSIONS["one"]
+    assert exprs[2] is _EXPRESSIONS["two"]
+    del exprs
 
     with pytest.raises(EmbeddedExpressionError, match=r"(?i).*YAML string.*"):
         loader.load("baz: !$ []")